@@ -8,19 +8,27 @@ from procnumnodocexec import (
     CompanyEnum,
     DecisionFileProcessor,
     ParserService,
+    dispose_async_engine,
     get_async_sessionmaker,
 )
 from procnumnodocexec.llm_provider import (
     get_azure_chains,
+    get_azure_combined_chain,
     get_azure_execution_doc_chains,
 )
 
+try:
+    import uvloop  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional speedup
+    uvloop = None  # type: ignore[assignment]
+
 
 async def _run() -> None:
     """Wire up repositories and run parser service."""
 
     Session = get_async_sessionmaker()
     extract_chain, classify_chain = get_azure_chains()
+    combined_chain = get_azure_combined_chain()
     exec_extract_chain, exec_classify_chain = get_azure_execution_doc_chains()
 
     file_processor = DecisionFileProcessor(
@@ -28,23 +36,30 @@ async def _run() -> None:
         classify_chain=classify_chain,
         execution_extract_chain=exec_extract_chain,
         execution_classify_chain=exec_classify_chain,
+        combined_chain=combined_chain,
     )
 
-    for company in (CompanyEnum.Ace, CompanyEnum.Unit):
-        view_repo = AsyncViewMessageDocumentRepository(company, Session)
-        exec_repo = AsyncMessageDocumentDecisionRepository(company, Session)
-        service = ParserService(
-            view_repo=view_repo,
-            exec_repo=exec_repo,
-            file_processor=file_processor,
-            company=company,
-        )
-        await service.run_decision()
-        await service.run_exec()
+    try:
+        for company in (CompanyEnum.Ace, CompanyEnum.Unit):
+            view_repo = AsyncViewMessageDocumentRepository(company, Session)
+            exec_repo = AsyncMessageDocumentDecisionRepository(company, Session)
+            service = ParserService(
+                view_repo=view_repo,
+                exec_repo=exec_repo,
+                file_processor=file_processor,
+                company=company,
+            )
+            await service.run_decision()
+            await service.run_exec()
+    finally:
+        await file_processor.aclose()
+        await dispose_async_engine()
 
 
 def main() -> None:
-    asyncio.run(_run())
+    # uvloop, when installed, replaces the pure-Python selector loop
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    asyncio.run(_run(), loop_factory=loop_factory)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 from .config import PROJECT_ROOT, SettingsDB, get_db_settings, get_smb_settings
-from .database import create_async_engine, create_tables, get_async_sessionmaker
+from .database import (
+    create_async_engine,
+    create_tables,
+    dispose_async_engine,
+    get_async_sessionmaker,
+)
 from .file_handler import DecisionFileProcessor, FileProcessor
 from .models import Base, DocsDecisionTable
 from .parser_service import ParserService
@@ -40,5 +45,6 @@ __all__ = [
     "message_document_DTO",
     "ParserService",
     "get_async_sessionmaker",
+    "dispose_async_engine",
     "CompanyEnum",
 ]
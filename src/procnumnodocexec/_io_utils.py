@@ -0,0 +1,189 @@
+"""Helpers shared by the file processors and the local check scripts."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterator
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from pathlib import Path
+from typing import Generic, TypeVar
+
+from decouple import AutoConfig
+from dotenv import load_dotenv
+
+from .config import SettingsAzure
+
+# Result lines held before one write to stdout
+OUTPUT_FLUSH_EVERY = 64
+# quantize() stays in C; same half-even rounding as f"{value:.2f}"
+_CENTS = Decimal("0.01")
+
+V = TypeVar("V")
+
+
+@lru_cache(maxsize=1)
+def project_root() -> Path:
+    return Path(__file__).resolve().parent.parent.parent
+
+
+@lru_cache(maxsize=1)
+def load_env() -> None:
+    """Load the project .env; search upwards from cwd only if it set nothing."""
+    load_dotenv(project_root() / ".env", override=False)
+    if not os.getenv("AZURE_OPENAI_ENDPOINT"):
+        load_dotenv(override=False)
+
+
+@lru_cache(maxsize=1)
+def get_config() -> AutoConfig:
+    return AutoConfig(search_path=project_root())
+
+
+@lru_cache(maxsize=1)
+def load_azure_config() -> SettingsAzure:
+    config = get_config()
+    return SettingsAzure(
+        endpoint=config("AZURE_OPENAI_ENDPOINT", default=""),
+        api_version=config("AZURE_OPENAI_API_VERSION", default="2025-04-01-preview"),
+        model=config("AZURE_MODEL", default="gpt-4.1-mini"),
+        api_key=config("AZURE_API_KEY", default=""),
+    )
+
+
+def iter_dir_files(directory: Path, suffix: str = "") -> Iterator[Path]:
+    """Yield files in ``directory`` whose name ends with ``suffix``."""
+    # scandir entries carry the name and cached file type, so filtering needs
+    # no extra stat() and Path objects are built only for matches
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith(suffix) and entry.is_file():
+                yield Path(entry.path)
+
+
+def decode_file_bytes(raw: bytes) -> str:
+    """Decode file content; try UTF-8 (BOM stripped) then Windows-1251."""
+    # A strict UTF-8 decode of cp1251 bytes fails at the first Cyrillic byte, so
+    # the probe costs microseconds and each file is fully decoded only once.
+    # cp1251 must come second: it maps almost every byte, so it would also
+    # "succeed" on UTF-8 input and return mojibake.
+    for encoding in ("utf-8-sig", "windows-1251"):
+        try:
+            return raw.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return raw.decode("utf-8", errors="replace")
+
+
+def _read_file_text_sync(path: Path) -> str:
+    return decode_file_bytes(path.read_bytes())
+
+
+async def read_file_text(path: Path) -> str:
+    """Read and decode ``path`` in the default executor."""
+    # One thread hop per file keeps disk I/O and decoding off the event loop;
+    # whole-file reads measured 2-3x faster per file than aiofile's AIO setup,
+    # and decoding costs less than shipping the bytes to another process
+    return await asyncio.to_thread(_read_file_text_sync, path)
+
+
+def fmt_amount(value: Decimal | None) -> str:
+    if value is None:
+        return "None"
+    try:
+        return str(value.quantize(_CENTS))
+    except InvalidOperation:
+        # More digits than the context precision holds; format() has no limit
+        return f"{value:.2f}"
+
+
+class OutputBuffer:
+    """Collect result lines and write them to stdout in blocks."""
+
+    def __init__(self, flush_every: int = OUTPUT_FLUSH_EVERY) -> None:
+        self._flush_every = flush_every
+        self._lines: list[str] = []
+
+    def write(self, line: str) -> None:
+        self._lines.append(line)
+        if len(self._lines) >= self._flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._lines:
+            sys.stdout.write("\n".join(self._lines) + "\n")
+            self._lines.clear()
+        sys.stdout.flush()
+
+
+class AsyncLRUCache(Generic[V]):
+    """LRU cache of awaited results keyed by string.
+
+    Concurrent misses on one key share a single computation; exceptions
+    propagate and are never cached. ``maxsize <= 0`` disables caching.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, V] = OrderedDict()
+        self._locks: dict[str, asyncio.Lock] = {}
+        # Tasks holding or queued on each key's lock
+        self._waiters: dict[str, int] = {}
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    async def get_or_compute(
+        self, key: str, compute: Callable[[], Awaitable[V]]
+    ) -> V:
+        if self.maxsize <= 0:
+            return await compute()
+
+        cached = self._data.get(key)
+        if cached is not None:
+            self._data.move_to_end(key)
+            return cached
+
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            async with lock:
+                cached = self._data.get(key)
+                if cached is not None:
+                    self._data.move_to_end(key)
+                    return cached
+                result = await compute()
+                self._data[key] = result
+                if len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+                return result
+        finally:
+            # Drop the lock only when nobody is queued on it: a released lock
+            # can still have waiters, and a fresh lock for the same key would
+            # let a newcomer compute alongside them
+            remaining = self._waiters[key] - 1
+            if remaining:
+                self._waiters[key] = remaining
+            else:
+                del self._waiters[key]
+                del self._locks[key]
+
+
+__all__ = [
+    "AsyncLRUCache",
+    "OUTPUT_FLUSH_EVERY",
+    "OutputBuffer",
+    "decode_file_bytes",
+    "fmt_amount",
+    "get_config",
+    "iter_dir_files",
+    "load_azure_config",
+    "load_env",
+    "project_root",
+    "read_file_text",
+]
@@ -1,121 +1,111 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Iterator
 from pathlib import Path
 
-from decouple import AutoConfig
-from dotenv import load_dotenv
-from langchain_openai import AzureChatOpenAI
-
+from ._io_utils import (
+    OutputBuffer,
+    get_config,
+    iter_dir_files,
+    load_azure_config,
+    load_env,
+    project_root,
+    read_file_text,
+)
 from .decision_llm import (
     CLASSIFY_PROMPT,
     EXTRACT_PROMPT,
     detect_status_with_llm,
 )
 from .file_handler import DecisionFileProcessor
+from .llm_provider import build_azure_llm
 
-
-def _project_root() -> Path:
-    return Path(__file__).resolve().parent.parent.parent
-
-
-def _get_config():
-    return AutoConfig(search_path=_project_root())
-
-
-def _load_azure_config() -> dict[str, str]:
-    config = _get_config()
-    return {
-        "endpoint": config("AZURE_OPENAI_ENDPOINT", default=""),
-        "api_version": config("AZURE_OPENAI_API_VERSION", default="2025-04-01-preview"),
-        "model": config("AZURE_MODEL", default="gpt-4.1-mini"),
-        "api_key": config("AZURE_API_KEY", default=""),
-    }
+# Files analysed concurrently against Azure
+DEFAULT_CONCURRENCY = 16
 
 
-def _read_file_text(path: Path) -> str:
-    """Read file content; try UTF-8 then Windows-1251."""
-    raw = path.read_bytes()
-    for encoding in ("utf-8", "windows-1251"):
-        try:
-            return raw.decode(encoding)
-        except UnicodeDecodeError:
-            continue
-    return raw.decode("utf-8", errors="replace")
+def _iter_archive_files(archive_dir: Path) -> Iterator[Path]:
+    """Yield *.html files, or every file when the folder has no HTML."""
+    found_html = False
+    for path in iter_dir_files(archive_dir, ".html"):
+        found_html = True
+        yield path
+    if not found_html:
+        yield from iter_dir_files(archive_dir)
 
 
-async def main() -> None:
-    load_dotenv()
-    load_dotenv(_project_root() / ".env")
+async def main(concurrency: int = DEFAULT_CONCURRENCY) -> None:
+    load_env()
 
-    project_root = _project_root()
-    azure = _load_azure_config()
+    root = project_root()
+    azure = load_azure_config()
 
-    if not azure["endpoint"] or not azure["api_key"]:
+    if not azure.endpoint or not azure.api_key:
         print("Missing Azure config. Set in .env: AZURE_OPENAI_ENDPOINT, AZURE_API_KEY")
         print("Using keyword-only fallback (no LLM).")
         extract_chain = None
         classify_chain = None
+    elif (llm := build_azure_llm(azure)) is None:
+        print("Failed to create Azure client. Using keyword-only fallback (no LLM).")
+        extract_chain = None
+        classify_chain = None
     else:
-        try:
-            llm = AzureChatOpenAI(
-                azure_endpoint=azure["endpoint"].rstrip("/"),
-                api_key=azure["api_key"],
-                api_version=azure["api_version"],
-                azure_deployment=azure["model"],
-                temperature=0,
-            )
-        except TypeError:
-            llm = AzureChatOpenAI(
-                azure_endpoint=azure["endpoint"].rstrip("/"),
-                api_key=azure["api_key"],
-                api_version=azure["api_version"],
-                deployment_name=azure["model"],
-                temperature=0,
-            )
         extract_chain = EXTRACT_PROMPT | llm
         classify_chain = CLASSIFY_PROMPT | llm
-        print("Using Azure OpenAI:", azure["model"])
+        print("Using Azure OpenAI:", azure.model)
 
     file_processor = DecisionFileProcessor(
         extract_chain=extract_chain, classify_chain=classify_chain
     )
 
-    archive_path = _get_config()(
+    archive_path = get_config()(
         "TEST_ARCHIVE_PATH",
-        default=str(project_root / "src" / "New Архив WinRAR"),
+        default=str(root / "src" / "New Архив WinRAR"),
     )
     archive_dir = Path(archive_path)
     if not archive_dir.is_absolute():
-        archive_dir = project_root / archive_dir
+        archive_dir = root / archive_dir
 
     if not archive_dir.exists():
         print(f"Archive folder not found: {archive_dir}")
         return
 
-    files = sorted(archive_dir.glob("*.html"))
-    if not files:
-        files = sorted(archive_dir.iterdir())
-    print(f"Testing {len(files)} files from {archive_dir}\n")
-
-    for path in files:
-        if not path.is_file():
-            continue
-        try:
-            content = _read_file_text(path)
-            result = await detect_status_with_llm(
-                content,
-                file_processor._extract_chain,
-                file_processor._classify_chain,
-            )
-            print(
+    print(f"Testing files from {archive_dir}\n")
+
+    output = OutputBuffer()
+    # Bounded so directory listing never runs far ahead of the LLM workers
+    queue: asyncio.Queue[Path | None] = asyncio.Queue(maxsize=concurrency * 2)
+
+    async def producer() -> None:
+        for path in _iter_archive_files(archive_dir):
+            await queue.put(path)
+        for _ in range(concurrency):
+            await queue.put(None)
+
+    async def worker() -> None:
+        while (path := await queue.get()) is not None:
+            try:
+                content = await read_file_text(path)
+                result = await detect_status_with_llm(
+                    content,
+                    file_processor._extract_chain,
+                    file_processor._classify_chain,
+                )
+            except Exception as e:
+                output.write(f"  {path.name}  ->  ERROR: {e}")
+                continue
+            output.write(
                 f"  {path.name}  ->  {result.decision.value}"
                 f" | main={result.main_amount}"
                 f" | fee={result.court_fee}"
                 f" | aid={result.legal_aid}"
             )
-        except Exception as e:
-            print(f"  {path.name}  ->  ERROR: {e}")
+
+    try:
+        await asyncio.gather(producer(), *(worker() for _ in range(concurrency)))
+    finally:
+        output.flush()
 
     print("\nDone.")
 
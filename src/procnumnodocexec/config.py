@@ -46,6 +46,8 @@ class SettingsSMB:
     password: str
     domain: str = ""
     folder_path: str = ""
+    # Concurrent file reads over the shared SMB session
+    max_parallel_downloads: int = 8
 
 
 @lru_cache(maxsize=1)
@@ -57,6 +59,9 @@ def get_smb_settings() -> SettingsSMB:
         username=_get_str("SMB_USERNAME", ""),
         password=_get_str("SMB_PASSWORD", ""),
         domain=_get_str("SMB_DOMAIN", ""),
+        max_parallel_downloads=cast(
+            int, _config("SMB_MAX_PARALLEL_DOWNLOADS", default=8, cast=int)
+        ),
     )
 
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from urllib.parse import quote_plus
 
 from sqlalchemy import create_engine
@@ -14,21 +15,33 @@ from sqlalchemy.ext.asyncio import (
 from .config import SettingsDB, get_db_settings
 from .models import SCHEMA_NAME, Base
 
+# Async pool sized for the parser's concurrent repository calls
+ASYNC_POOL_SIZE = 20
+ASYNC_MAX_OVERFLOW = 10
+ASYNC_POOL_RECYCLE = 1800
+# asyncpg server-side prepared statements kept per connection
+ASYNC_STATEMENT_CACHE_SIZE = 512
+
 
 def _get_connect_args(use_async_driver: bool) -> dict[str, object]:
     search_path = f"{SCHEMA_NAME},public"
     if use_async_driver:
-        return {"server_settings": {"search_path": search_path}}
+        return {
+            "server_settings": {"search_path": search_path},
+            "statement_cache_size": ASYNC_STATEMENT_CACHE_SIZE,
+        }
 
     return {"options": f"-csearch_path={search_path}"}
 
 
+@lru_cache(maxsize=4)
 def build_connection_url(
     settings: SettingsDB | None = None, use_async_driver: bool = False
 ) -> str:
     """Build a PostgreSQL connection URL using safely quoted credentials.
 
     For async engines set ``use_async_driver=True`` to use the ``asyncpg`` driver.
+    Results are cached; ``SettingsDB`` is frozen, so it is a stable cache key.
     """
 
     s = settings or get_db_settings()
@@ -52,22 +65,55 @@ def get_engine(echo: bool = False) -> Engine:
     )
 
 
+_ASYNC_ENGINES: dict[bool, AsyncEngine] = {}
+_ASYNC_SESSIONMAKERS: dict[bool, async_sessionmaker[AsyncSession]] = {}
+
+
 def get_async_engine(echo: bool = False) -> AsyncEngine:
-    """Create an asynchronous SQLAlchemy engine using an asyncio-compatible driver."""
+    """Return the shared asynchronous SQLAlchemy engine using asyncpg.
 
-    return create_async_engine(
-        build_connection_url(use_async_driver=True),
-        echo=echo,
-        future=True,
-        connect_args=_get_connect_args(use_async_driver=True),
-    )
+    The engine is cached per ``echo`` value so its connection pool and
+    statement caches are reused across sessionmakers and parser runs.
+    """
+
+    echo = bool(echo)
+    engine = _ASYNC_ENGINES.get(echo)
+    if engine is None:
+        url = build_connection_url(use_async_driver=True)
+        engine = create_async_engine(
+            f"{url}?prepared_statement_cache_size={ASYNC_STATEMENT_CACHE_SIZE}",
+            echo=echo,
+            future=True,
+            pool_size=ASYNC_POOL_SIZE,
+            max_overflow=ASYNC_MAX_OVERFLOW,
+            pool_recycle=ASYNC_POOL_RECYCLE,
+            connect_args=_get_connect_args(use_async_driver=True),
+        )
+        _ASYNC_ENGINES[echo] = engine
+    return engine
 
 
 def get_async_sessionmaker(echo: bool = False) -> async_sessionmaker[AsyncSession]:
-    """Return an async sessionmaker bound to a fresh async engine."""
+    """Return the shared async sessionmaker bound to the shared async engine."""
+
+    echo = bool(echo)
+    session_factory = _ASYNC_SESSIONMAKERS.get(echo)
+    if session_factory is None:
+        session_factory = async_sessionmaker(
+            get_async_engine(echo=echo), expire_on_commit=False
+        )
+        _ASYNC_SESSIONMAKERS[echo] = session_factory
+    return session_factory
+
+
+async def dispose_async_engine() -> None:
+    """Close pooled connections of the shared async engines and forget them."""
 
-    engine = get_async_engine(echo=echo)
-    return async_sessionmaker(engine, expire_on_commit=False)
+    engines = list(_ASYNC_ENGINES.values())
+    _ASYNC_ENGINES.clear()
+    _ASYNC_SESSIONMAKERS.clear()
+    for engine in engines:
+        await engine.dispose()
 
 
 async def create_tables_async(engine: AsyncEngine | None = None) -> None:
@@ -91,6 +137,7 @@ __all__ = [
     "get_engine",
     "get_async_engine",
     "get_async_sessionmaker",
+    "dispose_async_engine",
     "create_tables",
     "create_tables_async",
 ]
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import html
 import json
 import logging
+import os
 import re
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 from typing import Any
 
-from langchain_core.prompts import PromptTemplate
+from langchain_core.messages import SystemMessage
+from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import Runnable
 from pydantic import BaseModel, ConfigDict, ValidationError, field_validator
 from tenacity import (
@@ -20,8 +25,61 @@ from tenacity import (
     wait_exponential,
 )
 
+from ._io_utils import AsyncLRUCache
+from .llm_provider import get_llm_semaphore
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+_AMOUNT_CLEAN_RE = re.compile(r"[^0-9.-]")
+_JSON_DECODER = json.JSONDecoder()
+_ISO_DATE_RE = re.compile(r"(\d{4}-\d{1,2}-\d{1,2})")
+_DMY_RE = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{4})")
+_SHORT_DMY_RE = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{2})(?!\d)")
+_WORD_MONTH_RE = re.compile(
+    r"['\"«»„“”]?\s*(\d{1,2})\s*['\"«»„“”]?\s+([а-щьюяіїєґ']+)\s+(\d{4})(?:\s*(?:року|р\.?))?"
+)
+
+# Regex fallback patterns; each captures the amount or date text in group 1
+_AMOUNT_NEAR_RE = re.compile(
+    r"([0-9][0-9\s.,]*)(?:\s*\([^)]{1,120}\))?\s*(?:грн\.?|грив[а-я]*)",
+    re.IGNORECASE,
+)
+_MAIN_AMOUNT_RES = (
+    re.compile(
+        r"заборгован(?:ість|ості).{0,500}?у\s+розмірі\s*([0-9][0-9\s.,]*)",
+        re.IGNORECASE,
+    ),
+    re.compile(r"загальн(?:у|ої)\s+сум[ауи].{0,120}?([0-9][0-9\s.,]*)", re.IGNORECASE),
+)
+_COURT_FEE_RES = (
+    re.compile(
+        r"судов(?:ий|ого|і|их)\s+(?:збір|витрат).{0,180}?([0-9][0-9\s.,]*)\s*(?:грн\.?|грив[а-я]*)",
+        re.IGNORECASE,
+    ),
+)
+_COURT_FEE_KEYWORD_RE = re.compile(
+    r"судов(?:ий|ого|і|их)\s+(?:збір|витрат)", re.IGNORECASE
+)
+_LEGAL_AID_KEYWORD_RE = re.compile(r"правнич(?:у|ої|а)\s+допомог", re.IGNORECASE)
+_ISSUE_DATE_RES = (
+    re.compile(
+        r"(?:Виконавч(?:ий|ого)\s+лист(?:а)?\s+видан[оаі]\s*:?\s*)([^<\n]{0,120})",
+        re.IGNORECASE,
+    ),
+    re.compile(
+        r"(?:Дата\s+видачі\s+виконавч(?:ого|ий)\s+лист(?:а)?\s*:?\s*)([^<\n]{0,120})",
+        re.IGNORECASE,
+    ),
+)
+_BARE_DMY_RE = re.compile(r"(\d{1,2}\.\d{1,2}\.\d{4})")
+
 UK_MONTHS = {
     "січня": 1,
     "лютого": 2,
@@ -41,6 +99,18 @@ DEFAULT_LLM_TIMEOUT = 60
 LLM_RETRY_ATTEMPTS = 3
 LLM_RETRY_MIN_WAIT = 1
 LLM_RETRY_MAX_WAIT = 10
+# Max documents sent to the provider concurrently by *_batch helpers
+DEFAULT_LLM_BATCH_SIZE = 16
+# Trailing normalized characters analysed per document
+ANALYSIS_TEXT_CHARS = 12000
+# Raw characters normalized first; markup usually shrinks well below this
+_RAW_TAIL_CHARS = 40000
+# LLM extraction results kept by analysed-text hash; 0 disables the cache
+EXEC_DOC_CACHE_SIZE = int(os.getenv("PROCNUM_EXEC_DOC_CACHE_SIZE", "1024"))
+
+_exec_doc_cache: AsyncLRUCache[ExecutionDocAnalysisResult] = AsyncLRUCache(
+    EXEC_DOC_CACHE_SIZE
+)
 
 
 @dataclass(slots=True)
@@ -93,24 +163,19 @@ class ExecutionDocLLMResponse(BaseModel):
         return parsed
 
 
-EXTRACT_EXEC_DOC_PROMPT = PromptTemplate(
-    input_variables=["text"],
-    template="""Знайди у тексті фрагменти, які містять:
+# Instructions live in a literal system message so every request shares a
+# byte-identical prefix and only the document varies; this lets the provider
+# reuse its prompt-prefix cache. Keep these strings static (no dates/ids).
+_EXTRACT_EXEC_DOC_INSTRUCTIONS = """Знайди у тексті фрагменти, які містять:
 1) Основну суму стягнення за виконавчим листом (зазвичай заборгованість за кредитним договором).
 2) Судовий збір або судові витрати.
 3) Витрати на правничу (правову) допомогу.
 4) Дату видачі виконавчого листа / виконавчого документа.
 
 Витягни 8-20 найрелевантніших речень/рядків без пояснень.
+Документ буде в наступному повідомленні."""
 
-Документ:
-{text}
-""",
-)
-
-CLASSIFY_EXEC_DOC_PROMPT = PromptTemplate(
-    input_variables=["result"],
-    template="""На основі фрагментів визнач:
+_CLASSIFY_EXEC_DOC_INSTRUCTIONS = """На основі фрагментів визнач:
 1) main_amount_uah: основна сума стягнення.
 2) court_fee_uah: сума судового збору/судових витрат.
 3) legal_aid_uah: сума правничої допомоги.
@@ -123,26 +188,57 @@ CLASSIFY_EXEC_DOC_PROMPT = PromptTemplate(
 - Для execution_doc_issue_date використовуй саме фразу про видачу виконавчого листа/документа
   ("Виконавчий лист видано", "Дата видачі виконавчого листа" тощо), а не дату рішення.
 
-Текст:
-{result}
-
+Текст буде в наступному повідомленні.
 Відповідай тільки валідним JSON:
-{{
+{
   "main_amount_uah": 12345.67,
   "court_fee_uah": 123.45,
   "legal_aid_uah": 1000.00,
   "execution_doc_issue_date": "2026-02-03"
-}}
-""",
+}"""
+
+EXTRACT_EXEC_DOC_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        SystemMessage(content=_EXTRACT_EXEC_DOC_INSTRUCTIONS),
+        ("human", "Документ:\n{text}"),
+    ]
 )
 
+CLASSIFY_EXEC_DOC_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        SystemMessage(content=_CLASSIFY_EXEC_DOC_INSTRUCTIONS),
+        ("human", "Текст:\n{result}"),
+    ]
+)
+
+# Part of the result cache key, so editing a prompt invalidates old results
+_PROMPT_VERSION = hashlib.blake2b(
+    f"{_EXTRACT_EXEC_DOC_INSTRUCTIONS}\0{_CLASSIFY_EXEC_DOC_INSTRUCTIONS}".encode(
+        "utf-8"
+    ),
+    digest_size=8,
+).hexdigest()
+
 
 def _normalize_text(text: str) -> str:
-    text = html.unescape(text)
-    text = text.replace("\xa0", " ")
-    text = re.sub(r"<[^>]+>", " ", text)
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
+    # Same two passes as decision_llm: a fused (?:<[^>]+>|\s)+ pattern measured
+    # slower, and \s already matches \xa0, so no replace() pass is needed
+    text = _TAG_RE.sub(" ", html.unescape(text))
+    return _WS_RE.sub(" ", text).strip()
+
+
+def _analysis_text(text: str) -> str:
+    """Return the last ``ANALYSIS_TEXT_CHARS`` of ``_normalize_text(text)``."""
+    if len(text) > _RAW_TAIL_CHARS:
+        # Cut just after a literal ">": it ends any tag open at that point and
+        # can't sit inside an entity, so normalizing the rest yields a suffix
+        # of the fully normalized text (give or take one leading space)
+        cut = text.find(">", len(text) - _RAW_TAIL_CHARS)
+        if cut != -1:
+            tail = _normalize_text(text[cut + 1 :])
+            if len(tail) >= ANALYSIS_TEXT_CHARS:
+                return tail[-ANALYSIS_TEXT_CHARS:]
+    return _normalize_text(text)[-ANALYSIS_TEXT_CHARS:]
 
 
 def _response_text_from_chain_result(result: Any) -> str:
@@ -157,22 +253,56 @@ def _response_text_from_chain_result(result: Any) -> str:
 
 
 def _extract_json_block(text: str) -> str:
-    match = re.search(r"\{.*\}", text, flags=re.DOTALL)
-    return match.group(0) if match else text
+    first = text.find("{")
+    last = text.rfind("}")
+    if first == -1 or last < first:
+        return text
+    # The first "{" that starts a complete JSON object wins, so braces in a
+    # preamble or inside string values can't widen the block
+    start = first
+    while start != -1:
+        try:
+            _, end = _JSON_DECODER.raw_decode(text, start)
+        except ValueError:
+            start = text.find("{", start + 1, last)
+            continue
+        return text[start:end]
+    # Malformed output keeps the old first-"{"-to-last-"}" span so callers see
+    # the same error; find/rfind give it in linear time, unlike a DOTALL \{.*\}
+    # search that rescans from every "{" when no "}" follows
+    return text[first : last + 1]
+
+
+def _json_loads(text: str) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # Retry with json, which also accepts NaN/Infinity and huge ints
+            pass
+    return json.loads(text)
 
 
 def _parse_amount(value: Any) -> Decimal | None:
     if value is None:
         return None
+    if type(value) is int:
+        # Exact without the str() round-trip; bool keeps the path below
+        return Decimal(value)
     if isinstance(value, (int, float)):
         return Decimal(str(value))
     text = str(value).strip()
     if not text or text.lower() in {"null", "none", "n/a"}:
         return None
+    # Plain "12345.67" (the usual LLM output) needs none of the cleanup; ASCII
+    # only, since the regex below drops other Unicode digits
+    digits = text[1:] if text[0] == "-" else text
+    if digits.isascii() and digits.replace(".", "", 1).isdigit():
+        return Decimal(text)
     cleaned = text.replace("\xa0", " ").replace(" ", "")
     if "," in cleaned and "." not in cleaned:
         cleaned = cleaned.replace(",", ".")
-    cleaned = re.sub(r"[^0-9.-]", "", cleaned)
+    cleaned = _AMOUNT_CLEAN_RE.sub("", cleaned)
     if not cleaned or cleaned in {"-", "."}:
         return None
     try:
@@ -184,18 +314,26 @@ def _parse_amount(value: Any) -> Decimal | None:
 def _parse_date(value: Any) -> date | None:
     if value is None:
         return None
-    text = str(value).strip()
+    return _parse_date_text(str(value).strip())
+
+
+# Issue dates repeat across a batch; date results are immutable
+@lru_cache(maxsize=2048)
+def _parse_date_text(text: str) -> date | None:
     if not text or text.lower() in {"null", "none", "n/a"}:
         return None
 
-    iso_match = re.search(r"(\d{4}-\d{1,2}-\d{1,2})", text)
+    # Formats are tried in priority order, so they stay separate searches; the
+    # separator checks skip searches that cannot match
+    iso_match = _ISO_DATE_RE.search(text) if "-" in text else None
     if iso_match:
         try:
             return date.fromisoformat(iso_match.group(1))
         except ValueError:
             pass
 
-    dot_match = re.search(r"(\d{1,2})\.(\d{1,2})\.(\d{4})", text)
+    has_dot = "." in text
+    dot_match = _DMY_RE.search(text) if has_dot else None
     if dot_match:
         day, month, year = dot_match.groups()
         try:
@@ -203,7 +341,7 @@ def _parse_date(value: Any) -> date | None:
         except ValueError:
             return None
 
-    short_dot_match = re.search(r"(\d{1,2})\.(\d{1,2})\.(\d{2})(?!\d)", text)
+    short_dot_match = _SHORT_DMY_RE.search(text) if has_dot else None
     if short_dot_match:
         day, month, year = short_dot_match.groups()
         yy = int(year)
@@ -213,10 +351,7 @@ def _parse_date(value: Any) -> date | None:
         except ValueError:
             return None
 
-    word_month_match = re.search(
-        r"['\"«»„“”]?\s*(\d{1,2})\s*['\"«»„“”]?\s+([а-щьюяіїєґ']+)\s+(\d{4})(?:\s*(?:року|р\.?))?",
-        text.lower(),
-    )
+    word_month_match = _WORD_MONTH_RE.search(text.lower())
     if word_month_match:
         day, month_name, year = word_month_match.groups()
         month = UK_MONTHS.get(month_name)
@@ -229,9 +364,11 @@ def _parse_date(value: Any) -> date | None:
     return None
 
 
-def _find_first_amount_by_patterns(text: str, patterns: list[str]) -> Decimal | None:
+def _find_first_amount_by_patterns(
+    text: str, patterns: Iterable[re.Pattern[str]]
+) -> Decimal | None:
     for pattern in patterns:
-        for match in re.finditer(pattern, text, flags=re.IGNORECASE):
+        for match in pattern.finditer(text):
             value = _parse_amount(match.group(1))
             if value is not None:
                 return value
@@ -245,10 +382,10 @@ def _build_snippet(text: str, start: int, end: int, pad: int = 80) -> str:
 
 
 def _find_first_amount_with_snippet(
-    text: str, patterns: list[str]
+    text: str, patterns: Iterable[re.Pattern[str]]
 ) -> tuple[Decimal | None, str | None]:
     for pattern in patterns:
-        for match in re.finditer(pattern, text, flags=re.IGNORECASE):
+        for match in pattern.finditer(text):
             value = _parse_amount(match.group(1))
             if value is not None:
                 snippet = _build_snippet(text, match.start(), match.end())
@@ -256,98 +393,83 @@ def _find_first_amount_with_snippet(
     return None, None
 
 
-def _extract_amount_near_keyword(text: str, keyword_pattern: str) -> Decimal | None:
-    amount_pattern = re.compile(
-        r"([0-9][0-9\s.,]*)(?:\s*\([^)]{1,120}\))?\s*(?:грн\.?|грив[а-я]*)",
-        flags=re.IGNORECASE,
-    )
-    for keyword_match in re.finditer(keyword_pattern, text, flags=re.IGNORECASE):
+def _extract_amount_near_keyword(
+    text: str, keyword_pattern: re.Pattern[str]
+) -> Decimal | None:
+    for keyword_match in keyword_pattern.finditer(text):
         start = max(0, keyword_match.start() - 220)
         end = min(len(text), keyword_match.end() + 180)
         window = text[start:end]
 
-        candidates: list[tuple[int, Decimal]] = []
-        for amount_match in amount_pattern.finditer(window):
+        # Nearest amount wins; strict < keeps the earliest one on ties
+        best: Decimal | None = None
+        best_distance = 0
+        for amount_match in _AMOUNT_NEAR_RE.finditer(window):
             parsed = _parse_amount(amount_match.group(1))
             if parsed is None:
                 continue
             absolute_start = start + amount_match.start()
             distance = abs(absolute_start - keyword_match.start())
-            candidates.append((distance, parsed))
+            if best is None or distance < best_distance:
+                best, best_distance = parsed, distance
 
-        if candidates:
-            candidates.sort(key=lambda x: x[0])
-            return candidates[0][1]
+        if best is not None:
+            return best
     return None
 
 
 def _extract_amount_near_keyword_with_snippet(
-    text: str, keyword_pattern: str
+    text: str, keyword_pattern: re.Pattern[str]
 ) -> tuple[Decimal | None, str | None]:
-    amount_pattern = re.compile(
-        r"([0-9][0-9\s.,]*)(?:\s*\([^)]{1,120}\))?\s*(?:грн\.?|грив[а-я]*)",
-        flags=re.IGNORECASE,
-    )
-    for keyword_match in re.finditer(keyword_pattern, text, flags=re.IGNORECASE):
+    for keyword_match in keyword_pattern.finditer(text):
         start = max(0, keyword_match.start() - 220)
         end = min(len(text), keyword_match.end() + 180)
         window = text[start:end]
 
-        candidates: list[tuple[int, Decimal, int, int]] = []
-        for amount_match in amount_pattern.finditer(window):
+        # Nearest amount wins; strict < keeps the earliest one on ties
+        best: re.Match[str] | None = None
+        best_amount = Decimal(0)
+        best_distance = 0
+        for amount_match in _AMOUNT_NEAR_RE.finditer(window):
             parsed = _parse_amount(amount_match.group(1))
             if parsed is None:
                 continue
-            absolute_start = start + amount_match.start()
-            absolute_end = start + amount_match.end()
-            distance = abs(absolute_start - keyword_match.start())
-            candidates.append((distance, parsed, absolute_start, absolute_end))
+            distance = abs(start + amount_match.start() - keyword_match.start())
+            if best is None or distance < best_distance:
+                best, best_amount, best_distance = amount_match, parsed, distance
 
-        if candidates:
-            candidates.sort(key=lambda x: x[0])
-            _, parsed, abs_start, abs_end = candidates[0]
-            return parsed, _build_snippet(text, abs_start, abs_end)
+        if best is not None:
+            return best_amount, _build_snippet(
+                text, start + best.start(), start + best.end()
+            )
     return None, None
 
 
 def _fallback_extract_main_amount(text: str) -> tuple[Decimal | None, str | None]:
-    patterns = [
-        r"заборгован(?:ість|ості).{0,500}?у\s+розмірі\s*([0-9][0-9\s.,]*)",
-        r"загальн(?:у|ої)\s+сум[ауи].{0,120}?([0-9][0-9\s.,]*)",
-    ]
-    return _find_first_amount_with_snippet(text, patterns)
+    return _find_first_amount_with_snippet(text, _MAIN_AMOUNT_RES)
 
 
 def _fallback_extract_court_fee(text: str) -> tuple[Decimal | None, str | None]:
     explicit_after, explicit_snippet = _find_first_amount_with_snippet(
-        text,
-        [
-            r"судов(?:ий|ого|і|их)\s+(?:збір|витрат).{0,180}?([0-9][0-9\s.,]*)\s*(?:грн\.?|грив[а-я]*)",
-        ],
+        text, _COURT_FEE_RES
     )
     if explicit_after is not None:
         return explicit_after, explicit_snippet
-    return _extract_amount_near_keyword_with_snippet(
-        text, r"судов(?:ий|ого|і|их)\s+(?:збір|витрат)"
-    )
+    return _extract_amount_near_keyword_with_snippet(text, _COURT_FEE_KEYWORD_RE)
 
 
 def _fallback_extract_legal_aid(text: str) -> tuple[Decimal | None, str | None]:
-    return _extract_amount_near_keyword_with_snippet(text, r"правнич(?:у|ої|а)\s+допомог")
+    return _extract_amount_near_keyword_with_snippet(text, _LEGAL_AID_KEYWORD_RE)
 
 
 def _fallback_extract_issue_date(text: str) -> tuple[date | None, str | None]:
-    patterns = [
-        r"(?:Виконавч(?:ий|ого)\s+лист(?:а)?\s+видан[оаі]\s*:?\s*)([^<\n]{0,120})",
-        r"(?:Дата\s+видачі\s+виконавч(?:ого|ий)\s+лист(?:а)?\s*:?\s*)([^<\n]{0,120})",
-    ]
-    for pattern in patterns:
-        for match in re.finditer(pattern, text, flags=re.IGNORECASE):
+    for pattern in _ISSUE_DATE_RES:
+        for match in pattern.finditer(text):
             parsed = _parse_date(match.group(1))
             if parsed is not None:
                 return parsed, _build_snippet(text, match.start(), match.end())
 
-    for m in re.finditer(r"(\d{1,2}\.\d{1,2}\.\d{4})", text):
+    for m in _BARE_DMY_RE.finditer(text):
         left = text[max(0, m.start() - 90) : m.start()].lower()
         if "виконавч" in left and ("видан" in left or "видач" in left):
             parsed = _parse_date(m.group(1))
@@ -367,29 +489,50 @@ async def _ainvoke_with_timeout(
     input_dict: dict[str, str],
     timeout: float = DEFAULT_LLM_TIMEOUT,
 ) -> Any:
-    return await asyncio.wait_for(chain.ainvoke(input_dict), timeout=timeout)
+    # Same per-attempt slot as decision_llm: both pipelines share one limit
+    async with get_llm_semaphore():
+        return await asyncio.wait_for(chain.ainvoke(input_dict), timeout=timeout)
 
 
 def _regex_fallback_result(text: str) -> ExecutionDocAnalysisResult:
     normalized = _normalize_text(text)
-    main_amount, main_snippet = _fallback_extract_main_amount(normalized)
-    court_fee, court_snippet = _fallback_extract_court_fee(normalized)
-    legal_aid, legal_snippet = _fallback_extract_legal_aid(normalized)
-    issue_date, issue_date_snippet = _fallback_extract_issue_date(normalized)
+    # Every pattern for a field contains one of these stems, so a field whose
+    # stems are absent can't match; casefold covers IGNORECASE equivalents
+    folded = normalized.casefold()
+    main_value, main_snippet = (
+        _fallback_extract_main_amount(normalized)
+        if "заборгован" in folded or "загальн" in folded
+        else (None, None)
+    )
+    court_value, court_snippet = (
+        _fallback_extract_court_fee(normalized)
+        if "судов" in folded
+        else (None, None)
+    )
+    legal_value, legal_snippet = (
+        _fallback_extract_legal_aid(normalized)
+        if "правнич" in folded
+        else (None, None)
+    )
+    issue_date, issue_date_snippet = (
+        _fallback_extract_issue_date(normalized)
+        if "виконавч" in folded
+        else (None, None)
+    )
 
     return ExecutionDocAnalysisResult(
-        main_amount=main_amount,
-        court_fee=court_fee,
-        legal_aid=legal_aid,
+        main_amount=main_value,
+        court_fee=court_value,
+        legal_aid=legal_value,
         execution_doc_issue_date=issue_date,
         mode="fallback",
-        main_amount_source="regex" if main_amount is not None else None,
-        court_fee_source="regex" if court_fee is not None else None,
-        legal_aid_source="regex" if legal_aid is not None else None,
+        main_amount_source="regex" if main_value is not None else None,
+        court_fee_source="regex" if court_value is not None else None,
+        legal_aid_source="regex" if legal_value is not None else None,
         execution_doc_issue_date_source="regex" if issue_date is not None else None,
-        main_amount_confidence=0.75 if main_amount is not None else None,
-        court_fee_confidence=0.80 if court_fee is not None else None,
-        legal_aid_confidence=0.80 if legal_aid is not None else None,
+        main_amount_confidence=0.75 if main_value is not None else None,
+        court_fee_confidence=0.80 if court_value is not None else None,
+        legal_aid_confidence=0.80 if legal_value is not None else None,
         execution_doc_issue_date_confidence=0.92 if issue_date is not None else None,
         main_amount_snippet=main_snippet,
         court_fee_snippet=court_snippet,
@@ -398,6 +541,84 @@ def _regex_fallback_result(text: str) -> ExecutionDocAnalysisResult:
     )
 
 
+def _result_from_llm_response(
+    text_for_analysis: str, response: str
+) -> ExecutionDocAnalysisResult:
+    parsed_json_text = _extract_json_block(response)
+    parsed: dict[str, Any] = {}
+    try:
+        parsed = _json_loads(parsed_json_text)
+    except json.JSONDecodeError:
+        logger.debug("Failed to parse JSON in execution doc classifier response")
+    validated: ExecutionDocLLMResponse | None = None
+    if parsed:
+        try:
+            validated = ExecutionDocLLMResponse.model_validate(parsed)
+        except ValidationError as exc:
+            logger.debug("Execution doc LLM JSON schema validation failed: %s", exc)
+
+    if validated is not None:
+        llm_main = validated.main_amount_uah
+        llm_court = validated.court_fee_uah
+        llm_legal = validated.legal_aid_uah
+        llm_issue = validated.execution_doc_issue_date
+    else:
+        llm_main = llm_court = llm_legal = llm_issue = None
+
+    # Always run every extractor: their snippets are kept as evidence even for
+    # fields whose value comes from the LLM
+    fallback = _regex_fallback_result(text_for_analysis)
+    # A field counts as LLM-sourced when the LLM returned a value for it; the
+    # regex value is used only where the LLM's value is falsy
+    main_from_llm = llm_main is not None
+    court_from_llm = llm_court is not None
+    legal_from_llm = llm_legal is not None
+    issue_from_llm = llm_issue is not None
+    used_fallback = (
+        (not main_from_llm and fallback.main_amount is not None)
+        or (not court_from_llm and fallback.court_fee is not None)
+        or (not legal_from_llm and fallback.legal_aid is not None)
+        or (not issue_from_llm and fallback.execution_doc_issue_date is not None)
+    )
+    return ExecutionDocAnalysisResult(
+        main_amount=llm_main or fallback.main_amount,
+        court_fee=llm_court or fallback.court_fee,
+        legal_aid=llm_legal or fallback.legal_aid,
+        execution_doc_issue_date=llm_issue or fallback.execution_doc_issue_date,
+        mode="llm+fallback" if used_fallback else "llm",
+        main_amount_source="llm" if main_from_llm else fallback.main_amount_source,
+        court_fee_source="llm" if court_from_llm else fallback.court_fee_source,
+        legal_aid_source="llm" if legal_from_llm else fallback.legal_aid_source,
+        execution_doc_issue_date_source=(
+            "llm" if issue_from_llm else fallback.execution_doc_issue_date_source
+        ),
+        main_amount_confidence=(
+            0.88 if main_from_llm else fallback.main_amount_confidence
+        ),
+        court_fee_confidence=0.88 if court_from_llm else fallback.court_fee_confidence,
+        legal_aid_confidence=0.88 if legal_from_llm else fallback.legal_aid_confidence,
+        execution_doc_issue_date_confidence=(
+            0.90 if issue_from_llm else fallback.execution_doc_issue_date_confidence
+        ),
+        main_amount_snippet=fallback.main_amount_snippet,
+        court_fee_snippet=fallback.court_fee_snippet,
+        legal_aid_snippet=fallback.legal_aid_snippet,
+        execution_doc_issue_date_snippet=fallback.execution_doc_issue_date_snippet,
+    )
+
+
+def clear_execution_doc_cache() -> None:
+    """Drop all cached LLM extraction results."""
+    _exec_doc_cache.clear()
+
+
+def _exec_doc_cache_key(text_for_analysis: str) -> str:
+    digest = hashlib.blake2b(
+        text_for_analysis.encode("utf-8"), digest_size=16
+    ).hexdigest()
+    return f"{digest}|{_PROMPT_VERSION}"
+
+
 async def extract_execution_doc_data_with_llm(
     text: str,
     extract_chain: Runnable | None,
@@ -405,12 +626,17 @@ async def extract_execution_doc_data_with_llm(
     *,
     timeout: float = DEFAULT_LLM_TIMEOUT,
 ) -> ExecutionDocAnalysisResult:
-    text_for_analysis = _normalize_text(text)[-12000:]
+    """Extract amounts and the issue date, falling back to regexes on failure.
+
+    LLM results are cached per analysed text and prompt version, so a
+    document referenced by several records is sent to the provider once.
+    """
+    text_for_analysis = _analysis_text(text)
 
     if extract_chain is None or classify_chain is None:
         return _regex_fallback_result(text_for_analysis)
 
-    try:
+    async def compute() -> ExecutionDocAnalysisResult:
         extracted = _response_text_from_chain_result(
             await _ainvoke_with_timeout(
                 extract_chain, {"text": text_for_analysis}, timeout=timeout
@@ -423,84 +649,11 @@ async def extract_execution_doc_data_with_llm(
                 classify_chain, {"result": extracted}, timeout=timeout
             )
         )
-        parsed_json_text = _extract_json_block(response)
-        parsed: dict[str, Any] = {}
-        try:
-            parsed = json.loads(parsed_json_text)
-        except json.JSONDecodeError:
-            logger.debug("Failed to parse JSON in execution doc classifier response")
-        validated: ExecutionDocLLMResponse | None = None
-        if parsed:
-            try:
-                validated = ExecutionDocLLMResponse.model_validate(parsed)
-            except ValidationError as exc:
-                logger.debug("Execution doc LLM JSON schema validation failed: %s", exc)
-
-        llm_result = ExecutionDocAnalysisResult(
-            main_amount=validated.main_amount_uah if validated else None,
-            court_fee=validated.court_fee_uah if validated else None,
-            legal_aid=validated.legal_aid_uah if validated else None,
-            execution_doc_issue_date=(
-                validated.execution_doc_issue_date if validated else None
-            ),
-            mode="llm",
-            main_amount_source="llm" if validated and validated.main_amount_uah is not None else None,
-            court_fee_source="llm" if validated and validated.court_fee_uah is not None else None,
-            legal_aid_source="llm" if validated and validated.legal_aid_uah is not None else None,
-            execution_doc_issue_date_source=(
-                "llm" if validated and validated.execution_doc_issue_date is not None else None
-            ),
-            main_amount_confidence=0.88 if validated and validated.main_amount_uah is not None else None,
-            court_fee_confidence=0.88 if validated and validated.court_fee_uah is not None else None,
-            legal_aid_confidence=0.88 if validated and validated.legal_aid_uah is not None else None,
-            execution_doc_issue_date_confidence=(
-                0.90 if validated and validated.execution_doc_issue_date is not None else None
-            ),
-        )
+        return _result_from_llm_response(text_for_analysis, response)
 
-        fallback_result = _regex_fallback_result(text_for_analysis)
-        return ExecutionDocAnalysisResult(
-            main_amount=llm_result.main_amount or fallback_result.main_amount,
-            court_fee=llm_result.court_fee or fallback_result.court_fee,
-            legal_aid=llm_result.legal_aid or fallback_result.legal_aid,
-            execution_doc_issue_date=(
-                llm_result.execution_doc_issue_date
-                or fallback_result.execution_doc_issue_date
-            ),
-            mode=(
-                "llm+fallback"
-                if (
-                    (llm_result.main_amount is None and fallback_result.main_amount is not None)
-                    or (llm_result.court_fee is None and fallback_result.court_fee is not None)
-                    or (llm_result.legal_aid is None and fallback_result.legal_aid is not None)
-                    or (
-                        llm_result.execution_doc_issue_date is None
-                        and fallback_result.execution_doc_issue_date is not None
-                    )
-                )
-                else "llm"
-            ),
-            main_amount_source=llm_result.main_amount_source or fallback_result.main_amount_source,
-            court_fee_source=llm_result.court_fee_source or fallback_result.court_fee_source,
-            legal_aid_source=llm_result.legal_aid_source or fallback_result.legal_aid_source,
-            execution_doc_issue_date_source=(
-                llm_result.execution_doc_issue_date_source
-                or fallback_result.execution_doc_issue_date_source
-            ),
-            main_amount_confidence=llm_result.main_amount_confidence or fallback_result.main_amount_confidence,
-            court_fee_confidence=llm_result.court_fee_confidence or fallback_result.court_fee_confidence,
-            legal_aid_confidence=llm_result.legal_aid_confidence or fallback_result.legal_aid_confidence,
-            execution_doc_issue_date_confidence=(
-                llm_result.execution_doc_issue_date_confidence
-                or fallback_result.execution_doc_issue_date_confidence
-            ),
-            main_amount_snippet=llm_result.main_amount_snippet or fallback_result.main_amount_snippet,
-            court_fee_snippet=llm_result.court_fee_snippet or fallback_result.court_fee_snippet,
-            legal_aid_snippet=llm_result.legal_aid_snippet or fallback_result.legal_aid_snippet,
-            execution_doc_issue_date_snippet=(
-                llm_result.execution_doc_issue_date_snippet
-                or fallback_result.execution_doc_issue_date_snippet
-            ),
+    try:
+        return await _exec_doc_cache.get_or_compute(
+            _exec_doc_cache_key(text_for_analysis), compute
         )
     except (TimeoutError, ConnectionError, OSError):
         logger.warning("Execution doc LLM failed; using regex fallback", exc_info=False)
@@ -513,9 +666,36 @@ async def extract_execution_doc_data_with_llm(
         return _regex_fallback_result(text_for_analysis)
 
 
+async def extract_execution_doc_data_with_llm_batch(
+    texts: list[str],
+    extract_chain: Runnable | None,
+    classify_chain: Runnable | None,
+    *,
+    timeout: float = DEFAULT_LLM_TIMEOUT,
+    max_concurrency: int = DEFAULT_LLM_BATCH_SIZE,
+) -> list[ExecutionDocAnalysisResult]:
+    """Batched variant of ``extract_execution_doc_data_with_llm``.
+
+    Each document runs its extract and classify calls back to back, with at
+    most ``max_concurrency`` documents in flight. Results keep the order of
+    ``texts``; each document falls back to regex extraction on its own.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def extract(text: str) -> ExecutionDocAnalysisResult:
+        async with semaphore:
+            return await extract_execution_doc_data_with_llm(
+                text, extract_chain, classify_chain, timeout=timeout
+            )
+
+    return list(await asyncio.gather(*(extract(text) for text in texts)))
+
+
 __all__ = [
     "CLASSIFY_EXEC_DOC_PROMPT",
+    "DEFAULT_LLM_BATCH_SIZE",
     "EXTRACT_EXEC_DOC_PROMPT",
     "ExecutionDocAnalysisResult",
     "extract_execution_doc_data_with_llm",
+    "extract_execution_doc_data_with_llm_batch",
 ]
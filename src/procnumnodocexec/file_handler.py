@@ -1,18 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import logging
 from abc import ABC, abstractmethod
 from collections.abc import Awaitable, Callable
-from pathlib import Path
 from typing import TypeVar
 
-from aiofile import AIOFile
-
-from .config import PROJECT_ROOT
+from ._io_utils import decode_file_bytes
 from .decision_llm import detect_status_with_llm
 from .execution_doc_llm import extract_execution_doc_data_with_llm
 from .remote_client import RemoteFileClient
 from .schemas import DecisionAnalysisResult, ExecAnalysisResult
 
+logger = logging.getLogger(__name__)
+
 TResult = TypeVar("TResult")
 
 
@@ -27,6 +28,9 @@ class FileProcessor(ABC):
     async def process_exec(self, record: str) -> ExecAnalysisResult | None:
         """Process the file at local folder"""
 
+    async def aclose(self) -> None:
+        """Release connections held by the processor."""
+
 
 class DecisionFileProcessor(FileProcessor):
     """Placeholder implementation to be replaced with real processing logic."""
@@ -37,41 +41,45 @@ class DecisionFileProcessor(FileProcessor):
         classify_chain=None,
         execution_extract_chain=None,
         execution_classify_chain=None,
+        combined_chain=None,
+        client: RemoteFileClient | None = None,
     ) -> None:
         self._extract_chain = extract_chain
         self._classify_chain = classify_chain
         self._execution_extract_chain = execution_extract_chain
         self._execution_classify_chain = execution_classify_chain
-        self._client = RemoteFileClient()
+        self._combined_chain = combined_chain
+        # One client (and SMB session) for every record; see aclose()
+        self._client = client or RemoteFileClient()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
 
     @staticmethod
     def _decode_bytes(raw_content: bytes) -> str:
-        for encoding in ("windows-1251", "utf-8"):
-            try:
-                return raw_content.decode(encoding)
-            except UnicodeDecodeError:
-                continue
-        return raw_content.decode("utf-8", errors="replace")
-
-    async def _read_text_file(self, local_file: Path) -> str:
-        async with AIOFile(local_file, "rb") as afd:
-            raw_content: bytes | str = await afd.read()
-            if isinstance(raw_content, bytes):
-                return self._decode_bytes(raw_content)
-            return str(raw_content)
-
-    async def _parse_decision_in_file(self, local_file: Path) -> DecisionAnalysisResult:
-        content = await self._read_text_file(local_file)
-
-        decision_result = await detect_status_with_llm(
-            content,
-            self._extract_chain,
-            self._classify_chain,
-        )
-        exec_doc_result = await extract_execution_doc_data_with_llm(
-            content,
-            self._execution_extract_chain,
-            self._execution_classify_chain,
+        return decode_file_bytes(raw_content)
+
+    async def _read_record(self, record: str) -> str:
+        # Read straight into memory; a temp file would only be written, read
+        # back once and deleted
+        raw_content = await self._client.download_bytes(str(record))
+        return self._decode_bytes(raw_content)
+
+    async def _parse_decision(self, content: str) -> DecisionAnalysisResult:
+        # Independent LLM pipelines over the same text; each one already falls
+        # back to keywords/regexes when its own LLM calls fail
+        decision_result, exec_doc_result = await asyncio.gather(
+            detect_status_with_llm(
+                content,
+                self._extract_chain,
+                self._classify_chain,
+                combined_chain=self._combined_chain,
+            ),
+            extract_execution_doc_data_with_llm(
+                content,
+                self._execution_extract_chain,
+                self._execution_classify_chain,
+            ),
         )
         return DecisionAnalysisResult(
             decision=decision_result.decision,
@@ -82,8 +90,7 @@ class DecisionFileProcessor(FileProcessor):
             execution_doc_issue_date=exec_doc_result.execution_doc_issue_date,
         )
 
-    async def _parse_execution_doc_in_file(self, local_file: Path) -> ExecAnalysisResult:
-        content = await self._read_text_file(local_file)
+    async def _parse_execution_doc(self, content: str) -> ExecAnalysisResult:
         exec_doc_result = await extract_execution_doc_data_with_llm(
             content,
             self._execution_extract_chain,
@@ -99,27 +106,19 @@ class DecisionFileProcessor(FileProcessor):
     async def _process_file(
         self,
         record: str,
-        parser: Callable[[Path], Awaitable[TResult]],
+        parser: Callable[[str], Awaitable[TResult]],
     ) -> TResult | None:
-        temp_dir = PROJECT_ROOT / "tmp"
-        temp_dir.mkdir(parents=True, exist_ok=True)
-
-        local_file = None
         try:
-            local_file = await self._client.download_file(str(record), temp_dir)
-            return await parser(local_file)
+            return await parser(await self._read_record(record))
         except Exception as e:
-            print(f"Не вдалося обробити файл: {e}")
+            logger.warning("Не вдалося обробити файл %s: %s", record, e)
             return None
-        finally:
-            if local_file and local_file.exists():
-                local_file.unlink()
 
     async def process_decision(self, record: str) -> DecisionAnalysisResult | None:
-        return await self._process_file(record, self._parse_decision_in_file)
+        return await self._process_file(record, self._parse_decision)
 
     async def process_exec(self, record: str) -> ExecAnalysisResult | None:
-        return await self._process_file(record, self._parse_execution_doc_in_file)
+        return await self._process_file(record, self._parse_execution_doc)
 
 
 __all__ = ["FileProcessor", "DecisionFileProcessor"]
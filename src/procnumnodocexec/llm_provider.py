@@ -1,19 +1,71 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
+import weakref
+from functools import lru_cache
 from typing import Any, Tuple
 
 from langchain_core.runnables import Runnable
 
-from .config import get_azure_settings
-from .decision_llm import CLASSIFY_PROMPT, EXTRACT_PROMPT
-from .execution_doc_llm import CLASSIFY_EXEC_DOC_PROMPT, EXTRACT_EXEC_DOC_PROMPT
+from .config import SettingsAzure, get_azure_settings
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive pool shared by every chain built on the same Azure client; keep it
+# above PROCNUM_LLM_CONCURRENCY so calls never queue for a socket
+LLM_HTTP_MAX_CONNECTIONS = int(os.getenv("PROCNUM_LLM_HTTP_MAX_CONNECTIONS", "64"))
+# Max LLM calls in flight per event loop, shared by the decision and
+# execution-doc pipelines since both call the same deployment
+LLM_CONCURRENCY = int(os.getenv("PROCNUM_LLM_CONCURRENCY", "8"))
+
+_llm_semaphores: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, asyncio.Semaphore
+] = weakref.WeakKeyDictionary()
+
+
+def get_llm_semaphore() -> asyncio.Semaphore:
+    """Return the LLM-call semaphore of the running event loop."""
+    # One semaphore per loop: a semaphore can't be shared across event loops
+    loop = asyncio.get_running_loop()
+    semaphore = _llm_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(LLM_CONCURRENCY)
+        _llm_semaphores[loop] = semaphore
+    return semaphore
+
+
+def build_llm_client(max_connections: int = LLM_HTTP_MAX_CONNECTIONS) -> Any:
+    """Return an ``httpx.AsyncClient`` for the OpenAI SDK.
+
+    Half of the connections are kept alive between calls. The read timeout
+    matches the per-call LLM timeout so a stalled socket is dropped, not
+    left holding a pool slot.
+    """
+
+    import httpx
+
+    # Function-level: the LLM modules import this one for get_llm_semaphore
+    from .decision_llm import DEFAULT_LLM_TIMEOUT
+
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max(1, max_connections // 2),
+        ),
+        timeout=httpx.Timeout(DEFAULT_LLM_TIMEOUT),
+    )
+
+
+@lru_cache(maxsize=None)
+def build_azure_llm(azure: SettingsAzure) -> Any | None:
+    """Return one AzureChatOpenAI client per settings value.
+
+    The client is cached so every chain built from the same settings shares a
+    single HTTP connection pool instead of opening its own.
+    """
 
-def _build_azure_llm() -> Any | None:
-    azure = get_azure_settings()
     if not (azure.endpoint and azure.api_key and azure.model):
         return None
 
@@ -27,6 +79,7 @@ def _build_azure_llm() -> Any | None:
         "azure_endpoint": azure.endpoint.rstrip("/"),
         "api_key": azure.api_key,
         "api_version": azure.api_version,
+        "http_async_client": build_llm_client(),
     }
 
     llm = None
@@ -54,9 +107,15 @@ def _build_azure_llm() -> Any | None:
     return llm
 
 
+def _build_azure_llm() -> Any | None:
+    return build_azure_llm(get_azure_settings())
+
+
 def get_azure_chains() -> Tuple[Runnable | None, Runnable | None]:
     """Return (extract_chain, classify_chain) for decision parsing."""
 
+    from .decision_llm import CLASSIFY_PROMPT, EXTRACT_PROMPT
+
     llm = _build_azure_llm()
     if llm is None:
         return None, None
@@ -66,9 +125,23 @@ def get_azure_chains() -> Tuple[Runnable | None, Runnable | None]:
     return extract_chain, classify_chain
 
 
+def get_azure_combined_chain() -> Runnable | None:
+    """Return the single-call decision chain, or None without Azure config."""
+
+    from .decision_llm import COMBINED_PROMPT
+
+    llm = _build_azure_llm()
+    if llm is None:
+        return None
+
+    return COMBINED_PROMPT | llm
+
+
 def get_azure_execution_doc_chains() -> Tuple[Runnable | None, Runnable | None]:
     """Return (extract_chain, classify_chain) for execution document parsing."""
 
+    from .execution_doc_llm import CLASSIFY_EXEC_DOC_PROMPT, EXTRACT_EXEC_DOC_PROMPT
+
     llm = _build_azure_llm()
     if llm is None:
         return None, None
@@ -78,4 +151,11 @@ def get_azure_execution_doc_chains() -> Tuple[Runnable | None, Runnable | None]:
     return extract_chain, classify_chain
 
 
-__all__ = ["get_azure_chains", "get_azure_execution_doc_chains"]
+__all__ = [
+    "build_azure_llm",
+    "build_llm_client",
+    "get_azure_chains",
+    "get_azure_combined_chain",
+    "get_azure_execution_doc_chains",
+    "get_llm_semaphore",
+]
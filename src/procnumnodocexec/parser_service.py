@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+import os
+from collections.abc import Awaitable, Callable
 from datetime import date, timedelta
 
 from tqdm.asyncio import tqdm  # type: ignore
@@ -16,6 +19,13 @@ from .schemas import (
     message_document_DTO,
 )
 
+logger = logging.getLogger(__name__)
+
+# Records downloaded and parsed concurrently by each run_* pass
+RECORD_CONCURRENCY = int(os.getenv("PROCNUM_RECORD_CONCURRENCY", "10"))
+# Rows per bulk_insert call (one transaction each), written as they fill up
+INSERT_BATCH_SIZE = 500
+
 
 class ParserService:
     """Coordinates reading view records, processing files, and writing results."""
@@ -52,6 +62,89 @@ class ParserService:
             f"-> {date_range.end_year:04d}-{date_range.end_month:02d}-{date_range.end_day:02d}"
         )
 
+    @staticmethod
+    async def _process_all(
+        records: list[message_document_DTO],
+        process_record: Callable[[message_document_DTO], Awaitable[None]],
+    ) -> None:
+        """Run ``process_record`` over ``records`` with bounded workers.
+
+        ``RECORD_CONCURRENCY`` workers pull from one shared iterator, so only
+        that many tasks exist however long the record list is.
+        """
+        pending = iter(records)
+        with tqdm(total=len(records), desc="Processing records") as progress:
+
+            async def worker() -> None:
+                for record in pending:
+                    await process_record(record)
+                    progress.update(1)
+
+            async with asyncio.TaskGroup() as tg:
+                for _ in range(min(RECORD_CONCURRENCY, len(records))):
+                    tg.create_task(worker())
+
+    async def _insert_batch(self, batch: list[DocumentDecisionInsertDTO]) -> int:
+        """Insert one chunk in its own transaction; return rows that failed."""
+        try:
+            await self._exec_repo.bulk_insert(batch)
+        except Exception:
+            logger.exception("Помилка запису %s рядків", len(batch))
+            return len(batch)
+        return 0
+
+    async def _insert_rows(
+        self, rows: asyncio.Queue[DocumentDecisionInsertDTO | None]
+    ) -> int:
+        """Drain ``rows`` until ``None``; return rows that failed to insert.
+
+        A chunk is written as soon as it reaches ``INSERT_BATCH_SIZE`` rows, so
+        finished work is persisted even if the run stops partway.
+        """
+        failed = 0
+        batch: list[DocumentDecisionInsertDTO] = []
+        while (row := await rows.get()) is not None:
+            batch.append(row)
+            if len(batch) >= INSERT_BATCH_SIZE:
+                failed += await self._insert_batch(batch)
+                batch = []
+        if batch:
+            failed += await self._insert_batch(batch)
+        return failed
+
+    async def _process_and_insert(
+        self,
+        records: list[message_document_DTO],
+        process_record: Callable[
+            [message_document_DTO], Awaitable[DocumentDecisionInsertDTO | None]
+        ],
+    ) -> tuple[int, int]:
+        """Process ``records`` and insert their rows while processing runs.
+
+        Returns (rows built, rows that failed to insert).
+        """
+        # Bounded, so workers wait for the inserter instead of piling up rows
+        rows: asyncio.Queue[DocumentDecisionInsertDTO | None] = asyncio.Queue(
+            maxsize=INSERT_BATCH_SIZE
+        )
+        row_count = 0
+
+        async def process_and_queue(record: message_document_DTO) -> None:
+            nonlocal row_count
+            row = await process_record(record)
+            if row is not None:
+                await rows.put(row)
+                row_count += 1
+
+        inserter = asyncio.create_task(self._insert_rows(rows))
+        try:
+            await self._process_all(records, process_and_queue)
+        finally:
+            # Flush the partial chunk even when processing is interrupted
+            await rows.put(None)
+            failed = await inserter
+        return row_count, failed
+
     async def run(self) -> None:
         await self.run_decision()
 
@@ -66,54 +159,52 @@ class ParserService:
         )
         print(f"[{self._company.value}] decision: found {len(records)} records")
 
-        semaphore = asyncio.Semaphore(10)
-        success_count = 0
         error_count = 0
 
-        async def process_record(record: message_document_DTO) -> None:
-            nonlocal success_count, error_count
-            async with semaphore:
-                try:
-                    result = await self._file_processor.process_decision(
-                        record.local_path
-                    )
-                    created_at = record.message_createdAt
-
-                    if isinstance(result, DecisionEnum):
-                        result = DecisionAnalysisResult(decision=result)
-
-                    exec_record = DocumentDecisionInsertDTO(
-                        createdAt=created_at,
-                        caseNum=record.caseNum,
-                        procNum=record.procNum,
-                        decision=(
-                            result.decision
-                            if result is not None
-                            else DecisionEnum.UNKNOWN
-                        ),
-                        main_amount=result.main_amount if result else None,
-                        court_fee=result.court_fee if result else None,
-                        legal_aid=result.legal_aid if result else None,
-                        collector=self._company.value,
-                        date_of_decision=(result.date_of_decision if result else None),
-                        date_of_issuance=None,
-                        docType="рішен",
-                        local_file_path=record.local_path,
-                    )
-
-                    await self._exec_repo.bulk_insert([exec_record])
-                    success_count += 1
-
-                except Exception as e:
-                    error_count += 1
-                    print(f"Помилка обробки запису {record.procNum}: {e}")
-
-        tasks = []
-
-        for record in records:
-            tasks.append(asyncio.create_task(process_record(record)))
-
-        await tqdm.gather(*tasks, desc="Processing records")
+        async def process_record(
+            record: message_document_DTO,
+        ) -> DocumentDecisionInsertDTO | None:
+            nonlocal error_count
+            try:
+                result = await self._file_processor.process_decision(
+                    record.local_path
+                )
+                created_at = record.message_createdAt
+
+                if isinstance(result, DecisionEnum):
+                    result = DecisionAnalysisResult(decision=result)
+
+                exec_record = DocumentDecisionInsertDTO(
+                    createdAt=created_at,
+                    caseNum=record.caseNum,
+                    procNum=record.procNum,
+                    decision=(
+                        result.decision
+                        if result is not None
+                        else DecisionEnum.UNKNOWN
+                    ),
+                    main_amount=result.main_amount if result else None,
+                    court_fee=result.court_fee if result else None,
+                    legal_aid=result.legal_aid if result else None,
+                    collector=self._company.value,
+                    date_of_decision=(result.date_of_decision if result else None),
+                    date_of_issuance=None,
+                    docType="рішен",
+                    local_file_path=record.local_path,
+                )
+
+                return exec_record
+
+            except Exception:
+                error_count += 1
+                logger.exception("Помилка обробки запису %s", record.procNum)
+                return None
+
+        row_count, failed_inserts = await self._process_and_insert(
+            records, process_record
+        )
+        success_count = row_count - failed_inserts
+        error_count += failed_inserts
         print(
             f"[{self._company.value}] decision: done, success={success_count}, errors={error_count}"
         )
@@ -128,45 +219,43 @@ class ParserService:
             ilike_filter=[["викон", "лист"], ["викон", "докум"]],
         )
         print(f"[{self._company.value}] exec: found {len(records)} records")
-        semaphore = asyncio.Semaphore(10)
-        success_count = 0
         error_count = 0
 
-        async def process_record(record: message_document_DTO) -> None:
-            nonlocal success_count, error_count
-            async with semaphore:
-                try:
-                    result = await self._file_processor.process_exec(record.local_path)
-                    created_at = record.message_createdAt
-
-                    exec_record = DocumentDecisionInsertDTO(
-                        createdAt=created_at,
-                        caseNum=record.caseNum,
-                        procNum=record.procNum,
-                        decision=DecisionEnum.UNKNOWN,
-                        main_amount=result.main_amount if result else None,
-                        court_fee=result.court_fee if result else None,
-                        legal_aid=result.legal_aid if result else None,
-                        collector=self._company.value,
-                        date_of_decision=None,
-                        date_of_issuance=(result.date_of_issuance if result else None),
-                        docType="викон лист|докум",
-                        local_file_path=record.local_path,
-                    )
-
-                    await self._exec_repo.bulk_insert([exec_record])
-                    success_count += 1
-
-                except Exception as e:
-                    error_count += 1
-                    print(f"Помилка обробки запису {record.procNum}: {e}")
-
-        tasks = []
-
-        for record in records:
-            tasks.append(asyncio.create_task(process_record(record)))
-
-        await tqdm.gather(*tasks, desc="Processing records")
+        async def process_record(
+            record: message_document_DTO,
+        ) -> DocumentDecisionInsertDTO | None:
+            nonlocal error_count
+            try:
+                result = await self._file_processor.process_exec(record.local_path)
+                created_at = record.message_createdAt
+
+                exec_record = DocumentDecisionInsertDTO(
+                    createdAt=created_at,
+                    caseNum=record.caseNum,
+                    procNum=record.procNum,
+                    decision=DecisionEnum.UNKNOWN,
+                    main_amount=result.main_amount if result else None,
+                    court_fee=result.court_fee if result else None,
+                    legal_aid=result.legal_aid if result else None,
+                    collector=self._company.value,
+                    date_of_decision=None,
+                    date_of_issuance=(result.date_of_issuance if result else None),
+                    docType="викон лист|докум",
+                    local_file_path=record.local_path,
+                )
+
+                return exec_record
+
+            except Exception:
+                error_count += 1
+                logger.exception("Помилка обробки запису %s", record.procNum)
+                return None
+
+        row_count, failed_inserts = await self._process_and_insert(
+            records, process_record
+        )
+        success_count = row_count - failed_inserts
+        error_count += failed_inserts
         print(
             f"[{self._company.value}] exec: done, success={success_count}, errors={error_count}"
         )
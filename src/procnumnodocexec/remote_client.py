@@ -2,23 +2,40 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import shutil
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TypeVar
 
 import smbclient  # type: ignore[import]
 
 from .config import get_smb_settings
 
+T = TypeVar("T")
+
 logger = logging.getLogger(__name__)
 
+_BASE_FOLDER = "Utils\\Storage\\"
+_BASE_FOLDER_LOWER = _BASE_FOLDER.lower()
+
 
 class RemoteFileClient:
     """Асинхронний клієнт для роботи з віддаленими файлами через протокол SMB."""
 
-    _download_semaphore = asyncio.Semaphore(1)
-
     def __init__(self):
         self._config = get_smb_settings()
+        # \\server\share\ — однаковий для всіх файлів, будуємо один раз
+        server = self._config.server.strip("\\")
+        share = self._config.share.strip("\\")
+        self._share_prefix = f"\\\\{server}\\{share}\\"
+        # Обмежує кількість одночасних читань через одну SMB-сесію
+        max_downloads = max(1, self._config.max_parallel_downloads)
+        self._download_semaphore = asyncio.Semaphore(max_downloads)
+        # Власний пул потоків для читань: вони не конкурують з іншими
+        # to_thread-викликами за default executor (і навпаки)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_downloads, thread_name_prefix="smb-dl"
+        )
         self._session_registered = False
         # Лок для запобігання одночасній реєстрації сесії з кількох тасок
         self._session_lock = asyncio.Lock()
@@ -50,59 +67,55 @@ class RemoteFileClient:
                     logger.error(f"Failed to register SMB session: {e}")
                     raise
 
-    def _sync_download_task(self, unc_path: str, local_dest: Path) -> None:
-        """
-        Синхронна функція, яка виконує блокуюче IO.
-        Буде запущена в окремому потоці.
-        """
-        # smbclient.open_file та shutil.copyfileobj блокують виконання
+    async def _run_blocking(self, func: Callable[..., T], *args: object) -> T:
+        """Виконує блокуючу SMB-операцію у пулі потоків клієнта."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def aclose(self) -> None:
+        """Закриває SMB-сесію, якщо вона була зареєстрована, і пул потоків."""
+        self._executor.shutdown(wait=False)
+        async with self._session_lock:
+            if not self._session_registered:
+                return
+            self._session_registered = False
+            try:
+                await asyncio.to_thread(
+                    smbclient.delete_session,  # type: ignore
+                    self._config.server,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to close SMB session: {e}")
+
+    def _sync_read_task(self, unc_path: str) -> bytes:
+        """Синхронно читає весь віддалений файл у пам'ять (запускається в потоці)."""
         with smbclient.open_file(unc_path, mode="rb") as remote_f:  # type: ignore
-            with open(local_dest, "wb") as local_f:
-                shutil.copyfileobj(remote_f, local_f)
+            return remote_f.read()
+
+    def _unc_path(self, remote_rel_path: Path | str) -> str:
+        """Повертає UNC-шлях до файлу на сервері."""
+        clean_remote_path = str(remote_rel_path).replace("/", "\\").lstrip("\\")
+        if not clean_remote_path.lower().startswith(_BASE_FOLDER_LOWER):
+            clean_remote_path = _BASE_FOLDER + clean_remote_path
+        return self._share_prefix + clean_remote_path
 
-    async def download_file(
-        self, remote_rel_path: Path | str, local_dest: Path
-    ) -> Path:
+    async def download_bytes(self, remote_rel_path: Path | str) -> bytes:
         """
-        Асинхронно завантажує файл у вказану папку.
+        Асинхронно читає вміст віддаленого файлу без запису на диск.
 
         Args:
             remote_rel_path: Шлях на сервері (наприклад 'data/doc.pdf' or Path('data/doc.pdf'))
-            local_dest: ПОВНИЙ локальний шлях до ПАПКИ, куди зберігати файл.
 
         Returns:
-            Path до збереженого локального файлу (папка + ім'я файлу).
+            Вміст файлу.
         """
         await self._ensure_session()
-
-        # 1. Готуємо шлях для SMB (Windows-стандарт)
-        clean_remote_path = str(remote_rel_path).replace("/", "\\").lstrip("\\")
-        if clean_remote_path.startswith("\\"):
-            unc_path = clean_remote_path
-        else:
-            base_folder = "Utils\\Storage"
-            if not clean_remote_path.lower().startswith(base_folder.lower() + "\\"):
-                clean_remote_path = f"{base_folder}\\{clean_remote_path}"
-
-            server = self._config.server.strip("\\")
-            share = self._config.share.strip("\\")
-            unc_path = f"\\\\{server}\\{share}\\{clean_remote_path}"
-
-        # 2. Формуємо повний локальний шлях до файлу
-        # Витягуємо ім'я файлу (працює коректно, навіть якщо скрипт на Linux)
-        file_name: str = clean_remote_path.split("\\")[-1]
-        final_local_path = local_dest / file_name
+        unc_path = self._unc_path(remote_rel_path)
 
         try:
             async with self._download_semaphore:
-                logger.info(f"Starting download: {unc_path} -> {final_local_path}")
-
-                # 3. Запускаємо скачування, передаючи повний шлях до файлу
-                await asyncio.to_thread(
-                    self._sync_download_task, unc_path, final_local_path
-                )
-
-                return final_local_path
+                logger.info(f"Starting download: {unc_path} -> memory")
+                return await self._run_blocking(self._sync_read_task, unc_path)
 
         except Exception as e:
             logger.error(f"Error downloading file {unc_path}: {e}")
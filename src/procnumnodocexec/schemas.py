@@ -58,9 +58,14 @@ class DocumentDecisionInsertDTO:
     collector: str
     date_of_decision: date | None
     docType: str
-    local_file_path: str
+    local_file_path: str = ""
     date_of_issuance: date | None = None
 
+    def __post_init__(self) -> None:
+        # The column is NOT NULL; normalize once here rather than per insert
+        if self.local_file_path is None:
+            self.local_file_path = ""
+
 
 @dataclass
 class SMBConfig:
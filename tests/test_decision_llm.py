@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+import json
+import unittest
+
+from langchain_core.runnables import RunnableLambda
+
+from procnumnodocexec.decision_llm import (
+    _extract_date_from_header,
+    _extract_json_block,
+    _hard_rule_decision,
+    _parse_amount,
+    _parse_date,
+    clear_decision_cache,
+    detect_status_with_llm,
+)
+from procnumnodocexec.schemas import DecisionAnalysisResult, DecisionEnum
+
+# Reasoning text that precedes the operative part in real decisions
+_FILLER = "Керуючись статтями процесуального кодексу, суд дійшов висновку. " * 3
+
+
+class DecisionDateParsingTests(unittest.TestCase):
+    def test_parse_word_month_date(self) -> None:
+        cases = {
+            "2 грудня 2025 року": date(2025, 12, 2),
+            "«2» листопада 2023": date(2023, 11, 2),
+            "15 Грудня 2025": date(2025, 12, 15),
+            "5 травень 2020": date(2020, 5, 5),
+            "12 листопад 2023": date(2023, 11, 12),
+            "2 листи 2023": None,
+            "12 листів 2023": None,
+            "2 травми 2020": None,
+            "5 foo 2025": None,
+        }
+        for value, expected in cases.items():
+            with self.subTest(value=value):
+                self.assertEqual(_parse_date(value), expected)
+
+    def test_header_skips_words_that_look_like_months(self) -> None:
+        header = (
+            "<p>Надіслано 2 листи 2023 відповідачу.</p>"
+            "<p>Рішення від 14 березня 2024 року</p>"
+        )
+        self.assertEqual(_extract_date_from_header(header), date(2024, 3, 14))
+
+
+class HardRuleDecisionTests(unittest.TestCase):
+    def test_single_phrase_decides(self) -> None:
+        cases = {
+            "у задоволенні позову відмовити": DecisionEnum.NEGATIVE,
+            "в задоволенні позову відмовити": DecisionEnum.NEGATIVE,
+            "у задоволенні позовних вимог відмовити": DecisionEnum.NEGATIVE,
+            "в задоволенні позовних вимог відмовити": DecisionEnum.NEGATIVE,
+            "позов залишити без задоволення": DecisionEnum.NEGATIVE,
+            "позовну заяву залишити без задоволення": DecisionEnum.NEGATIVE,
+            "позов задовольнити частково": DecisionEnum.PARTIAL,
+            "позовні вимоги задовольнити частково": DecisionEnum.PARTIAL,
+            "позов задовольнити повністю": DecisionEnum.POSITIVE,
+            "позовні вимоги задовольнити повністю": DecisionEnum.POSITIVE,
+        }
+        for phrase, expected in cases.items():
+            with self.subTest(phrase=phrase):
+                self.assertEqual(
+                    _hard_rule_decision(f"{_FILLER.lower()} {phrase}. стягнути"),
+                    expected,
+                )
+
+    def test_conflicting_or_missing_phrases_give_no_decision(self) -> None:
+        cases = {
+            "conflict": "позов задовольнити частково. "
+            "в задоволенні решти позовних вимог відмовити. "
+            "у задоволенні позову відмовити",
+            "positive and partial": "позов задовольнити повністю; "
+            "позовні вимоги задовольнити частково",
+            "none": "позов задовольнити. стягнути з відповідача",
+            "empty": "",
+        }
+        for label, text in cases.items():
+            with self.subTest(case=label):
+                self.assertIsNone(_hard_rule_decision(text))
+
+    def test_repeated_phrases_of_one_decision_still_decide(self) -> None:
+        self.assertEqual(
+            _hard_rule_decision(
+                "у задоволенні позову відмовити; позов залишити без задоволення"
+            ),
+            DecisionEnum.NEGATIVE,
+        )
+
+
+class DetectStatusRoutingTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        clear_decision_cache()
+        self.addCleanup(clear_decision_cache)
+        self.calls: list[dict[str, str]] = []
+
+        def combined(inputs: dict[str, str]) -> str:
+            self.calls.append(inputs)
+            return json.dumps(
+                {"status": "часткове", "main_amount_uah": "1234.56"}
+            )
+
+        self.combined_chain = RunnableLambda(combined)
+
+    async def _detect(self, resolution: str) -> DecisionAnalysisResult:
+        text = f"<p>Рішення</p><p>ВИРІШИВ:</p><p>{resolution} {_FILLER}</p>"
+        return await detect_status_with_llm(
+            text, None, None, combined_chain=self.combined_chain
+        )
+
+    async def test_negative_hard_rule_skips_llm(self) -> None:
+        result = await self._detect("У задоволенні позову відмовити.")
+
+        self.assertEqual(result.decision, DecisionEnum.NEGATIVE)
+        self.assertEqual(self.calls, [])
+
+    async def test_other_resolutions_go_to_llm(self) -> None:
+        resolutions = {
+            "none": "Позов задовольнити.",
+            "conflict": "Позов задовольнити частково. "
+            "У задоволенні позову відмовити.",
+            "positive rule": "Позов задовольнити повністю. "
+            "Стягнути 1 234,56 грн.",
+            "partial rule": "Позов задовольнити частково. Стягнути 1 234,56 грн.",
+        }
+        for label, resolution in resolutions.items():
+            with self.subTest(case=label):
+                self.calls.clear()
+                result = await self._detect(resolution)
+
+                self.assertEqual(result.decision, DecisionEnum.PARTIAL)
+                self.assertEqual(result.main_amount, Decimal("1234.56"))
+                self.assertEqual(len(self.calls), 1)
+
+    async def test_short_resolution_still_goes_to_llm(self) -> None:
+        result = await detect_status_with_llm(
+            "<p>ВИРІШИВ:</p><p>позов задовольнити, стягнути 1 234,56 грн</p>",
+            None,
+            None,
+            combined_chain=self.combined_chain,
+        )
+
+        self.assertEqual(result.main_amount, Decimal("1234.56"))
+        self.assertEqual(len(self.calls), 1)
+
+
+class ExtractJsonBlockTests(unittest.TestCase):
+    def test_extracts_first_complete_object(self) -> None:
+        cases = {
+            '```json\n{"status": "позитивне"}\n```': '{"status": "позитивне"}',
+            '{"a": 1}': '{"a": 1}',
+            'Відповідь {коротко}: {"a": 1}': '{"a": 1}',
+            '{"a": "}"} x {"b": 1}': '{"a": "}"}',
+            '{"a": {"b": 2}} tail': '{"a": {"b": 2}}',
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(_extract_json_block(text), expected)
+
+    def test_malformed_json_keeps_outer_span(self) -> None:
+        cases = {
+            '{"a": } tail': '{"a": }',
+            '{"a": 1': '{"a": 1',
+            "no json": "no json",
+            "} reversed {": "} reversed {",
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(_extract_json_block(text), expected)
+
+
+class ParseAmountTests(unittest.TestCase):
+    def test_parse_amount(self) -> None:
+        cases: dict[object, Decimal | None] = {
+            "12345.67": Decimal("12345.67"),
+            "-5": Decimal("-5"),
+            "100": Decimal("100"),
+            100: Decimal("100"),
+            2.5: Decimal("2.5"),
+            "12 345,67": Decimal("12345.67"),
+            "12\xa0000.00 грн": Decimal("12000.00"),
+            "1.2.3": None,
+            "١٢٣": None,
+            "": None,
+            "null": None,
+            "-": None,
+        }
+        for value, expected in cases.items():
+            with self.subTest(value=value):
+                self.assertEqual(_parse_amount(value), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,71 +1,204 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import date
+import json
 from pathlib import Path
 from decimal import Decimal
 import unittest
+from unittest.mock import patch
 
+from langchain_core.runnables import RunnableLambda
 from pydantic import ValidationError
+from tenacity import wait_none
 
+from procnumnodocexec import llm_provider
+from procnumnodocexec._io_utils import decode_file_bytes
+from procnumnodocexec.decision_llm import clear_decision_cache, detect_status_with_llm
 from procnumnodocexec.execution_doc_llm import (
     ExecutionDocLLMResponse,
+    _ainvoke_with_timeout,
     _parse_date,
+    clear_execution_doc_cache,
     extract_execution_doc_data_with_llm,
+    extract_execution_doc_data_with_llm_batch,
 )
 
 
-def _project_root() -> Path:
-    return Path(__file__).resolve().parent.parent
+_HTML_DIR = Path(__file__).resolve().parent.parent / "data test html"
+
+# Per fixture: expected result attributes, and fields whose regex snippet
+# must be present
+_FALLBACK_EXPECTATIONS: dict[str, tuple[dict[str, object], tuple[str, ...]]] = {
+    "1.html": (
+        {
+            "mode": "fallback",
+            "main_amount": Decimal("12724"),
+            "court_fee": Decimal("2422.40"),
+            "legal_aid": Decimal("4000"),
+            "execution_doc_issue_date": date(2026, 2, 3),
+            "main_amount_source": "regex",
+            "execution_doc_issue_date_source": "regex",
+        },
+        ("execution_doc_issue_date",),
+    ),
+    "2.html": (
+        {
+            "main_amount": Decimal("38485"),
+            "court_fee": None,
+            "legal_aid": None,
+            "execution_doc_issue_date": date(2026, 2, 2),
+            "main_amount_source": "regex",
+            "execution_doc_issue_date_source": "regex",
+        },
+        ("main_amount", "execution_doc_issue_date"),
+    ),
+    "3.html": (
+        {
+            "main_amount": Decimal("15750.90"),
+            "court_fee": Decimal("2422.40"),
+            "legal_aid": Decimal("3500.00"),
+            "execution_doc_issue_date": date(2026, 2, 3),
+            "court_fee_source": "regex",
+            "legal_aid_source": "regex",
+        },
+        ("court_fee", "legal_aid"),
+    ),
+}
 
 
 def _read_file_text(path: Path) -> str:
-    raw = path.read_bytes()
-    for encoding in ("utf-8", "windows-1251"):
-        try:
-            return raw.decode(encoding)
-        except UnicodeDecodeError:
-            continue
-    return raw.decode("utf-8", errors="replace")
+    return decode_file_bytes(path.read_bytes())
 
 
 class ExecutionDocLLMTests(unittest.IsolatedAsyncioTestCase):
-    async def test_fallback_extracts_expected_values_for_1_html(self) -> None:
-        text = _read_file_text(_project_root() / "data test html" / "1.html")
-        result = await extract_execution_doc_data_with_llm(text, None, None)
-
-        self.assertEqual(result.mode, "fallback")
-        self.assertEqual(result.main_amount, Decimal("12724"))
-        self.assertEqual(result.court_fee, Decimal("2422.40"))
-        self.assertEqual(result.legal_aid, Decimal("4000"))
-        self.assertEqual(result.execution_doc_issue_date, date(2026, 2, 3))
-        self.assertEqual(result.main_amount_source, "regex")
-        self.assertEqual(result.execution_doc_issue_date_source, "regex")
-        self.assertIsNotNone(result.execution_doc_issue_date_snippet)
-
-    async def test_fallback_extracts_expected_values_for_2_html(self) -> None:
-        text = _read_file_text(_project_root() / "data test html" / "2.html")
-        result = await extract_execution_doc_data_with_llm(text, None, None)
-
-        self.assertEqual(result.main_amount, Decimal("38485"))
-        self.assertIsNone(result.court_fee)
-        self.assertIsNone(result.legal_aid)
-        self.assertEqual(result.execution_doc_issue_date, date(2026, 2, 2))
-        self.assertEqual(result.main_amount_source, "regex")
-        self.assertEqual(result.execution_doc_issue_date_source, "regex")
-
-    async def test_fallback_extracts_expected_values_for_3_html(self) -> None:
-        text = _read_file_text(_project_root() / "data test html" / "3.html")
-        result = await extract_execution_doc_data_with_llm(text, None, None)
-
-        self.assertEqual(result.main_amount, Decimal("15750.90"))
-        self.assertEqual(result.court_fee, Decimal("2422.40"))
-        self.assertEqual(result.legal_aid, Decimal("3500.00"))
-        self.assertEqual(result.execution_doc_issue_date, date(2026, 2, 3))
-        self.assertEqual(result.court_fee_source, "regex")
-        self.assertEqual(result.legal_aid_source, "regex")
+    async def test_fallback_extracts_expected_values(self) -> None:
+        for name, (expected, snippet_fields) in _FALLBACK_EXPECTATIONS.items():
+            with self.subTest(file=name):
+                text = _read_file_text(_HTML_DIR / name)
+                result = await extract_execution_doc_data_with_llm(text, None, None)
+
+                for field, value in expected.items():
+                    self.assertEqual(getattr(result, field), value, field)
+                for field in snippet_fields:
+                    self.assertIsNotNone(getattr(result, f"{field}_snippet"), field)
+
+    async def test_batch_keeps_order_and_falls_back_per_document(self) -> None:
+        clear_execution_doc_cache()
+        self.addCleanup(clear_execution_doc_cache)
+        flaky_calls: list[str] = []
+
+        def classify(inputs: dict[str, str]) -> str:
+            if "broken" in inputs["result"]:
+                raise ConnectionError("provider unavailable")
+            if "flaky" in inputs["result"] and not flaky_calls:
+                flaky_calls.append(inputs["result"])
+                raise TimeoutError("transient")
+            return json.dumps(
+                {
+                    "main_amount_uah": inputs["result"].split()[-1],
+                    "execution_doc_issue_date": "2026-02-03",
+                }
+            )
+
+        extract_chain = RunnableLambda(lambda inputs: inputs["text"])
+        classify_chain = RunnableLambda(classify)
+        texts = [
+            "<p>first 100</p>",
+            "<p>broken заборгованість у розмірі 500 грн</p>",
+            "<p>flaky 300</p>",
+        ]
+
+        # Retries go through the same tenacity policy as single documents
+        with patch.object(_ainvoke_with_timeout.retry, "wait", wait_none()):
+            results = await extract_execution_doc_data_with_llm_batch(
+                texts, extract_chain, classify_chain, max_concurrency=2
+            )
+
+        self.assertEqual(
+            [r.main_amount for r in results],
+            [Decimal("100"), Decimal("500"), Decimal("300")],
+        )
+        self.assertEqual([r.mode for r in results], ["llm", "fallback", "llm"])
+        self.assertEqual(len(flaky_calls), 1)
+
+    async def test_llm_result_is_cached_per_document(self) -> None:
+        clear_execution_doc_cache()
+        self.addCleanup(clear_execution_doc_cache)
+        calls: list[str] = []
+
+        def classify(inputs: dict[str, str]) -> str:
+            calls.append(inputs["result"])
+            return json.dumps({"main_amount_uah": 100})
+
+        extract_chain = RunnableLambda(lambda inputs: inputs["text"])
+        classify_chain = RunnableLambda(classify)
+
+        first = await extract_execution_doc_data_with_llm(
+            "<p>same document</p>", extract_chain, classify_chain
+        )
+        second = await extract_execution_doc_data_with_llm(
+            "<div>same document</div>", extract_chain, classify_chain
+        )
+
+        self.assertEqual(first.main_amount, Decimal("100"))
+        self.assertEqual(second.main_amount, Decimal("100"))
+        self.assertEqual(len(calls), 1)
+
+    async def test_llm_filled_field_keeps_regex_snippet(self) -> None:
+        clear_execution_doc_cache()
+        self.addCleanup(clear_execution_doc_cache)
+        extract_chain = RunnableLambda(lambda inputs: inputs["text"])
+        classify_chain = RunnableLambda(
+            lambda inputs: json.dumps({"main_amount_uah": 600})
+        )
+
+        result = await extract_execution_doc_data_with_llm(
+            "<p>Стягнути заборгованість у розмірі 500 грн</p>",
+            extract_chain,
+            classify_chain,
+        )
+
+        self.assertEqual(result.main_amount, Decimal("600"))
+        self.assertEqual(result.main_amount_source, "llm")
+        self.assertIn("500 грн", result.main_amount_snippet or "")
+
+    async def test_llm_calls_share_the_provider_concurrency_limit(self) -> None:
+        clear_execution_doc_cache()
+        clear_decision_cache()
+        self.addCleanup(clear_execution_doc_cache)
+        self.addCleanup(clear_decision_cache)
+        in_flight = peak = 0
+
+        async def respond(inputs: dict[str, str]) -> str:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return json.dumps({"main_amount_uah": 1, "status": "часткове"})
+
+        chain = RunnableLambda(respond)
+        with patch.object(llm_provider, "LLM_CONCURRENCY", 1):
+            await asyncio.gather(
+                extract_execution_doc_data_with_llm("<p>a</p>", chain, chain),
+                extract_execution_doc_data_with_llm("<p>b</p>", chain, chain),
+                detect_status_with_llm("<p>c</p>", None, None, combined_chain=chain),
+            )
+
+        self.assertEqual(peak, 1)
 
     def test_parse_short_year_date(self) -> None:
-        self.assertEqual(_parse_date("08.12.25"), date(2025, 12, 8))
+        cases = {
+            "08.12.25": date(2025, 12, 8),
+            "3.2.26": date(2026, 2, 3),
+            "01.01.69": date(2069, 1, 1),
+            "01.01.70": date(1970, 1, 1),
+            "31.02.25": None,
+        }
+        for value, expected in cases.items():
+            with self.subTest(value=value):
+                self.assertEqual(_parse_date(value), expected)
 
     def test_llm_schema_validation_rejects_unknown_field(self) -> None:
         with self.assertRaises(ValidationError):
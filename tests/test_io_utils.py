@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+from decimal import Decimal
+import unittest
+
+from procnumnodocexec._io_utils import AsyncLRUCache, fmt_amount
+
+
+class FmtAmountTests(unittest.TestCase):
+    def test_fmt_amount(self) -> None:
+        cases = {
+            None: "None",
+            Decimal("12724"): "12724.00",
+            Decimal("2422.4"): "2422.40",
+            Decimal("0.015"): "0.02",
+            Decimal("1E+30"): "1000000000000000000000000000000.00",
+            Decimal("Infinity"): "Infinity",
+        }
+        for value, expected in cases.items():
+            with self.subTest(value=value):
+                self.assertEqual(fmt_amount(value), expected)
+
+
+class AsyncLRUCacheTests(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_misses_share_one_computation(self) -> None:
+        cache: AsyncLRUCache[int] = AsyncLRUCache(4)
+        calls = 0
+
+        async def compute() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return 42
+
+        results = await asyncio.gather(
+            *(cache.get_or_compute("key", compute) for _ in range(3))
+        )
+
+        self.assertEqual(results, [42, 42, 42])
+        self.assertEqual(calls, 1)
+
+    async def test_failed_computation_keeps_key_serialized(self) -> None:
+        cache: AsyncLRUCache[int] = AsyncLRUCache(4)
+        running = peak = 0
+
+        async def compute() -> int:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            raise ValueError("not cached")
+
+        first = asyncio.create_task(cache.get_or_compute("key", compute))
+        queued = asyncio.create_task(cache.get_or_compute("key", compute))
+        await asyncio.wait([first])
+        # Arrives while the queued task recomputes after the first failure
+        late = asyncio.create_task(cache.get_or_compute("key", compute))
+        results = await asyncio.gather(first, queued, late, return_exceptions=True)
+
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+        self.assertEqual(peak, 1)
+        self.assertEqual(cache._locks, {})
+
+
+if __name__ == "__main__":
+    unittest.main()